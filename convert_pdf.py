@@ -1,5 +1,6 @@
+import asyncio
 import base64
-import time
+import threading
 import io
 import os
 import re
@@ -7,11 +8,20 @@ import subprocess
 import tempfile
 import shutil
 import argparse
+import functools
 import sys
 from PIL import Image
 import shutil
-from openai import OpenAI
-from typing import List, Optional, Any, Dict
+import random
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, RateLimitError
+from typing import Iterator, List, Optional, Any, Dict, Union
+
+# PyMuPDF renders pages in-process (no subprocess, no temp files) and is
+# preferred when installed; poppler/pdftocairo stays as the fallback.
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
 
 # For colored output:
 import colorama
@@ -23,7 +33,17 @@ colorama.init(autoreset=True)
 DEFAULT_MODEL: str = "gpt-4o"       # Use this model, unless the user passes another one as argument
 FALLBACK_MODEL: str = "gpt-4o-mini" # Use this model if the primary one fails
 
-VALID_MODELS: List[str] = [
+# Longest allowed edge (in pixels) of a page image sent to the vision API.
+# Larger pages are downscaled before encoding: OpenAI bills per 512-px tile,
+# so oversized renders cost tokens and upload time without helping accuracy.
+DEFAULT_MAX_IMAGE_EDGE: int = 1536
+
+# How many pages may be in flight at the OpenAI API simultaneously. The calls
+# are network-bound and independent, so processing pages concurrently gives a
+# near-linear speedup up to this limit.
+MAX_CONCURRENT_PAGES: int = 8
+
+VALID_MODELS: "frozenset[str]" = frozenset({
     "o1",
     "o1-2024-12-17",
     "o1-preview",
@@ -61,7 +81,10 @@ VALID_MODELS: List[str] = [
     "gpt-3.5-turbo-1106",
     "gpt-3.5-turbo-0125",
     "gpt-3.5-turbo-16k-0613",
-]
+})
+
+# Stable, human-friendly ordering for help/error messages.
+_VALID_MODELS_DISPLAY: "tuple[str, ...]" = tuple(sorted(VALID_MODELS))
 
 def _help(parser: argparse.ArgumentParser, error_message: Optional[str] = None) -> None:
     """
@@ -74,60 +97,140 @@ def _help(parser: argparse.ArgumentParser, error_message: Optional[str] = None)
     parser.print_help(sys.stderr)
     sys.exit(1)
 
-def call_pdftocairo(
+def _poppler_exe(poppler_path: str, name: str) -> str:
+    exe: str = os.path.join(poppler_path, name)
+    if os.name == 'nt' and not os.path.exists(exe):
+        exe += ".exe"
+    return exe
+
+def _pdftocairo_cmd(
     pdf_path: str,
     out_dir: str,
     poppler_path: str,
-    dpi: int = 300,
-    extra_args: Optional[List[str]] = None
-) -> None:
-    if extra_args is None:
-        extra_args = []
-
-    pdftocairo_exe: str = os.path.join(poppler_path, "pdftocairo")
-    if os.name == 'nt' and not os.path.exists(pdftocairo_exe):
-        pdftocairo_exe += ".exe"
-
+    dpi: int,
+    extra_args: List[str],
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None
+) -> List[str]:
+    """
+    Build a pdftocairo command line, optionally restricted to the page range
+    [first_page, last_page] (both inclusive, 1-based).
+    """
+    # JPEG instead of PNG: the pages go straight to the vision API, and a
+    # quality-85 JPEG is 3-5x smaller than the equivalent PNG while being
+    # much cheaper to encode.
     cmd: List[str] = [
-        pdftocairo_exe,
-        "-png",
+        _poppler_exe(poppler_path, "pdftocairo"),
+        "-jpeg",
+        "-jpegopt", "quality=85,progressive=y",
         "-r", str(dpi),
-    ] + extra_args + [
+    ]
+    if first_page is not None:
+        cmd += ["-f", str(first_page)]
+    if last_page is not None:
+        cmd += ["-l", str(last_page)]
+    return cmd + extra_args + [
         pdf_path,
         os.path.join(out_dir, "page")
     ]
 
-    print("[pdftocairo] Converting PDF to images... This may take a while.")
-
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def _pdf_page_count(pdf_path: str, poppler_path: str) -> Optional[int]:
+    """
+    Ask pdfinfo for the number of pages in the PDF. Returns None if pdfinfo
+    is unavailable or its output can't be parsed.
+    """
     try:
-        # Poll the process every 3 seconds and print a message if still running
-        while True:
-            time.sleep(3)
-            ret = proc.poll()
-            if ret is not None:
-                # Process finished
-                break
+        result = subprocess.run(
+            [_poppler_exe(poppler_path, "pdfinfo"), pdf_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    match: Optional[re.Match] = re.search(r'^Pages:\s+(\d+)', result.stdout.decode('utf-8', 'replace'), re.MULTILINE)
+    return int(match.group(1)) if match else None
+
+def _wait_with_heartbeat(procs: List[subprocess.Popen]) -> None:
+    """
+    Block until all pdftocairo processes finish. A daemon thread prints a
+    heartbeat every 30 s so long conversions still show signs of life.
+    Raises CalledProcessError if any process fails.
+    """
+    done = threading.Event()
+
+    def heartbeat() -> None:
+        while not done.wait(30):
             print("[pdftocairo] ...still working, please wait...")
 
-        # Now check the return code
+    ticker = threading.Thread(target=heartbeat, daemon=True)
+    ticker.start()
+    try:
+        outputs = [proc.communicate() for proc in procs]
+    finally:
+        done.set()
+        ticker.join()
+
+    for proc, (stdout, stderr) in zip(procs, outputs):
         if proc.returncode != 0:
-            stdout, stderr = proc.communicate()
             print(stdout.decode('utf-8'))
             print(stderr.decode('utf-8'))
-            raise subprocess.CalledProcessError(proc.returncode, cmd)
-    finally:
-        proc.stdout.close()
-        proc.stderr.close()
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+def call_pdftocairo(
+    pdf_path: str,
+    out_dir: str,
+    poppler_path: str,
+    dpi: int = 300,
+    extra_args: Optional[List[str]] = None,
+    jobs: Optional[int] = None
+) -> None:
+    """
+    Rasterize the PDF into out_dir. pdftocairo is single-threaded, so when
+    the page count is known the work is split into `jobs` page-range chunks
+    (default: half the CPU cores) that run as concurrent processes. Output
+    filenames carry the real page numbers, so the chunks never collide.
+    """
+    if extra_args is None:
+        extra_args = []
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 2) // 2)
+
+    num_pages: Optional[int] = _pdf_page_count(pdf_path, poppler_path)
+    if num_pages is not None:
+        jobs = min(jobs, num_pages)
+
+    print("[pdftocairo] Converting PDF to images... This may take a while.")
+
+    procs: List[subprocess.Popen] = []
+    if num_pages is None or jobs <= 1:
+        # Page count unknown (or nothing to split): single process.
+        cmd = _pdftocairo_cmd(pdf_path, out_dir, poppler_path, dpi, extra_args)
+        procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+    else:
+        chunk_size: int = -(-num_pages // jobs)  # ceil division
+        for start in range(1, num_pages + 1, chunk_size):
+            end: int = min(start + chunk_size - 1, num_pages)
+            cmd = _pdftocairo_cmd(
+                pdf_path, out_dir, poppler_path, dpi, extra_args,
+                first_page=start, last_page=end
+            )
+            procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+
+    _wait_with_heartbeat(procs)
 
     print("[pdftocairo] Done! Images are in:", out_dir)
     return
 
-def convert_pdf_to_images(pdf_path: str, poppler_path: str, debug: bool = False) -> List[Image.Image]:
+def convert_pdf_to_images(pdf_path: str, poppler_path: str, debug: bool = False) -> Iterator[bytes]:
     """
-    Convert all pages in a PDF to Pillow Image objects by calling pdftocairo manually.
-    If debug=True, also copy each page PNG into the current working directory
-    as page_1.png, page_2.png, etc. so you can inspect them later.
+    Convert all pages in a PDF to raw JPEG bytes by calling pdftocairo manually,
+    yielding one page at a time so callers never hold the whole PDF in memory.
+    The pdftocairo output is already in the format we send to the API, so the
+    pages are never decoded into pixel buffers here.
+    If debug=True, also copy each page JPEG into the current working directory
+    as page_1.jpg, page_2.jpg, etc. so you can inspect them later.
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         call_pdftocairo(
@@ -138,53 +241,120 @@ def convert_pdf_to_images(pdf_path: str, poppler_path: str, debug: bool = False)
             extra_args=["-antialias", "subpixel"]
         )
 
-        images: List[Image.Image] = []
-
-        for fname in sorted(os.listdir(tmpdir)):
-            if fname.startswith("page-") and fname.endswith(".png"):
-                src_path: str = os.path.join(tmpdir, fname)
-
-                if debug:
-                    local_debug_name: str = fname.replace("page-", "page_")
+        # Sort by the numeric page index: zero-padding can differ between the
+        # parallel pdftocairo page-range chunks, so a lexicographic sort of
+        # the filenames is not reliable. os.scandir hands back the entry name
+        # and full path in one directory pass, without per-file stat calls.
+        page_files: List["tuple[int, str]"] = []
+        for entry in os.scandir(tmpdir):
+            match = re.match(r'page-(\d+)\.jpg$', entry.name)
+            if match:
+                page_files.append((int(match.group(1)), entry.path))
+        page_files.sort()
+
+        for page_no, src_path in page_files:
+            if debug:
+                local_debug_name: str = f"page_{page_no}.jpg"
+                try:
+                    # A hardlink shares the inode with the temp file, so the
+                    # page survives the tempdir cleanup without a byte copy.
+                    if os.path.exists(local_debug_name):
+                        os.remove(local_debug_name)
+                    os.link(src_path, local_debug_name)
+                except OSError:
+                    # Cross-device or unsupported (e.g. some Windows setups):
+                    # fall back to a plain copy.
                     shutil.copy2(src_path, local_debug_name)
 
-                with Image.open(src_path) as im:
-                    images.append(im.copy())
+            with open(src_path, "rb") as f:
+                yield f.read()
+
+def convert_pdf_with_pymupdf(pdf_path: str, debug: bool = False) -> Iterator[bytes]:
+    """
+    Render all pages in a PDF to raw JPEG bytes in-process with PyMuPDF,
+    yielding one page at a time. Unlike the poppler path there is no
+    subprocess and no temp-file round-trip: MuPDF rasterizes straight into
+    a pixmap that is encoded to JPEG in memory.
+    If debug=True, also save each page JPEG into the current working
+    directory as page_1.jpg, page_2.jpg, etc. so you can inspect them later.
+    """
+    print("[pymupdf] Converting PDF to images...")
+    doc = fitz.open(pdf_path)
+    try:
+        for page_index, page in enumerate(doc, start=1):
+            pix = page.get_pixmap(dpi=120)
+            page_bytes: bytes = pix.tobytes("jpeg", jpg_quality=85)
+            if debug:
+                with open(f"page_{page_index}.jpg", "wb") as f:
+                    f.write(page_bytes)
+            yield page_bytes
+    finally:
+        doc.close()
 
-        return images
+# Scratch buffer reused by _downscale for the JPEG re-encode. Safe to share:
+# the downscale+encode of one page runs without yielding to the event loop,
+# and the buffer contents are consumed (base64-encoded) before the next page
+# touches it.
+_ENCODE_BUF: io.BytesIO = io.BytesIO()
 
-def encode_image_to_base64(pil_image: Image.Image) -> str:
+def _downscale(page_bytes: bytes, max_edge: int = DEFAULT_MAX_IMAGE_EDGE) -> Union[bytes, memoryview]:
+    """
+    Downscale a JPEG page so its longest edge is at most max_edge pixels,
+    using Lanczos resampling. Pages that are already small enough are
+    returned untouched (no decode/re-encode cost).
     """
-    Encode a Pillow Image into base64 (PNG format) without saving to disk.
+    with Image.open(io.BytesIO(page_bytes)) as im:
+        if max(im.size) <= max_edge:
+            return page_bytes
+        im.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+        if im.mode != "RGB":
+            # pdftocairo JPEGs are already RGB, so this is normally a no-op.
+            im = im.convert("RGB")
+        _ENCODE_BUF.seek(0)
+        _ENCODE_BUF.truncate()
+        im.save(_ENCODE_BUF, format="JPEG", quality=85)
+        # getbuffer() hands out a memoryview, so the base64 step below sees
+        # the JPEG bytes without another full-page copy.
+        return _ENCODE_BUF.getbuffer()
+
+def encode_image_to_base64(image_bytes: Union[bytes, memoryview]) -> str:
     """
-    buffer: io.BytesIO = io.BytesIO()
-    pil_image.save(buffer, format="PNG")
-    buffer.seek(0)
-    encoded_str: str = base64.b64encode(buffer.read()).decode("utf-8")
-    return encoded_str
+    Encode raw image bytes (as produced by pdftocairo) into base64.
+    """
+    return base64.b64encode(image_bytes).decode("ascii")
+
+# Compiled once at import: matches a fenced ```markdown ... ``` block and
+# captures its contents. Reused for every page/response.
+_MD_BLOCK_RE: "re.Pattern[str]" = re.compile(r"```(?:markdown)?\s*([\s\S]*?)\s*```")
 
 def extract_markdown_from_response(response_text: str) -> str:
     """
     Extract the text between triple backticks. If multiple blocks, just return
     the first match. If nothing is found, return an empty string.
     """
-    pattern: str = r"```(?:markdown)?\s*([\s\S]*?)\s*```"
-    match: Optional[re.Match] = re.search(pattern, response_text)
-    if match:
-        return match.group(1).strip()
-    else:
-        return ""
+    blocks: List[str] = extract_markdown_blocks_from_response(response_text)
+    return blocks[0] if blocks else ""
 
-def attempt_markdown_extraction(
-    client: OpenAI,
+def extract_markdown_blocks_from_response(response_text: str) -> List[str]:
+    """
+    Extract *all* fenced markdown blocks from the response, in order. Used
+    when several pages were batched into one request and the model returns
+    one block per page.
+    """
+    return [m.strip() for m in _MD_BLOCK_RE.findall(response_text)]
+
+async def attempt_markdown_extraction(
+    client: AsyncOpenAI,
     message_content: List[Dict[str, Any]],
     primary_model: str,
     fallback_model: str,
-    max_retries: int = 3
-) -> Optional[str]:
+    max_retries: int = 3,
+    expected_blocks: int = 1
+) -> Optional[List[str]]:
     """
-    Attempt to get a markdown block from the response. 
-    1) Up to max_retries with primary_model. 
+    Attempt to get `expected_blocks` markdown blocks from the response
+    (one per page in the request).
+    1) Up to max_retries with primary_model.
     2) If that fails, up to max_retries with fallback_model.
     3) Return None if all attempts fail.
 
@@ -197,37 +367,73 @@ def attempt_markdown_extraction(
     # Track if we are on the first attempt for primary vs fallback
     # so we can print "retry..." lines only when it's actually a retry.
     
-    def try_model(model_name: str, is_retry: bool) -> Optional[str]:
+    async def try_model(model_name: str, is_retry: bool) -> Optional[List[str]]:
         """
-        Sends the prompt to the specified model, returns extracted Markdown or None.
+        Sends the prompt to the specified model, returns the extracted Markdown
+        blocks or None if the response didn't contain one non-empty block per
+        requested page.
         If it's a retry attempt, we print '    retry with model model_name...'
         Otherwise, we keep it silent for the first attempt of each model.
         """
         if is_retry:
             print(f"    retry with model {model_name}...")
-        response = client.chat.completions.create(
+        # Stream the completion so tokens are consumed while the model is
+        # still generating, instead of waiting for the full response object.
+        # An empty or malformed stream simply yields no markdown block below
+        # and falls through to the normal retry path.
+        response = await client.chat.completions.create(
             model=model_name,
             messages=[{"role": "user", "content": message_content}],
+            stream=True,
         )
-        response_text = response.choices[0].message.content
-        md_content = extract_markdown_from_response(response_text)
-        return md_content if md_content.strip() else None
+        parts: List[str] = []
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        response_text = "".join(parts)
+        md_blocks = extract_markdown_blocks_from_response(response_text)
+        if len(md_blocks) != expected_blocks or not all(b.strip() for b in md_blocks):
+            return None
+        return md_blocks
+
+    async def backoff(attempt: int) -> None:
+        """
+        Exponential backoff with jitter before retry number `attempt`, so
+        immediate re-submits don't pile onto a rate-limited or flaky API.
+        """
+        await asyncio.sleep(min(60, 2 ** attempt + random.uniform(0, 1)))
+
+    # Transient API failures (rate limits, timeouts, connection drops) are
+    # treated like an empty response: back off and retry.
+    transient_errors = (RateLimitError, APITimeoutError, APIConnectionError)
 
     # 1) Try primary model up to max_retries
     for attempt in range(max_retries):
         is_retry = (attempt > 0)  # attempt 0 is first, attempt 1+ is retry
-        md = try_model(primary_model, is_retry=is_retry)
+        if is_retry:
+            await backoff(attempt)
+        try:
+            md = await try_model(primary_model, is_retry=is_retry)
+        except transient_errors as exc:
+            print(f"    API error ({type(exc).__name__}), backing off...")
+            md = None
         if md is not None:
             if is_retry:
                 print("    success!")
             return md
-    
+
     # If primary model fails all attempts, we switch to fallback
     print(f"    retry with model {fallback_model}...")  # indicates switching to fallback
     # 2) Try fallback model up to max_retries
     for attempt in range(max_retries):
         # For fallback, every attempt is effectively a 'retry' from the user's perspective
-        md = try_model(fallback_model, is_retry=True)
+        if attempt > 0:
+            await backoff(attempt)
+        try:
+            md = await try_model(fallback_model, is_retry=True)
+        except transient_errors as exc:
+            print(f"    API error ({type(exc).__name__}), backing off...")
+            md = None
         if md is not None:
             print("    success!")
             return md
@@ -236,85 +442,237 @@ def attempt_markdown_extraction(
     print(f"{Fore.RED}    failed!{Style.RESET_ALL}")
     return None
 
-def pdf_pages_to_vision_api(
+# Invariant pieces of the transcription prompt, assembled once at import so
+# the per-page work is just formatting the short page-number intro.
+_PROMPT_BODY: str = (
+    "Your task is to extract **all** visible text exactly as it appears, in strict top-left to bottom-right reading order. "
+    "Do **not** reorder or relocate headings, paragraphs, or tables—wherever something appears on the page, it must remain in that exact position in your output. "
+    "Do **not** fix, skip, or summarize any text; preserve the exact wording, numbering, and spacing.\n\n"
+    "# Markdown Formatting Rules\n"
+    "1. **Headings**: Use standard Markdown syntax (#, ##, ###, etc.) for headings. If the heading appears in the middle of the page, keep it there—do not move it to the top.\n"
+    "2. **Tables**: Use standard Markdown table syntax (rows/columns with pipes and dashes). If the text in a cell spans multiple lines in the image, replace line breaks with '<br>' within the same cell.\n"
+    "3. **References**: If you see references like 'Offset address' or 'Reset value,' or any other labels/annotations, include them exactly where they appear.\n"
+    "4. **Footnotes**: The only text you may ignore is a small footnote at the bottom margin that typically contains a URL and a page number. Everything else on the page must be transcribed.\n\n"
+)
+
+_PROMPT_OUTPUT_SINGLE: str = (
+    "# Output Requirements\n"
+    "- Return the transcribed text as a single Markdown block enclosed in triple backticks (```markdown ... ```). "
+    "- Do **not** add extra commentary, interpretation, or summary—only the transcribed text in the correct order.\n\n"
+)
+
+_PROMPT_FOOTER: str = (
+    "Again, keep the **exact** sequence from top-left to bottom-right, including all headings, paragraphs, tables, and references in their original positions."
+)
+
+# Matches the '# Page N' section headers this script writes, used to detect
+# already-converted pages when resuming an interrupted run.
+_PAGE_HEADER_RE: "re.Pattern[str]" = re.compile(r'^# Page (\d+)$', re.MULTILINE)
+
+def _parse_existing_markdown(md_file_path: str) -> Dict[int, str]:
+    """
+    Parse a previously written output file into {page number: section content}.
+    Used for resume support: pages that already have real content don't need
+    another (expensive) API call.
+    """
+    with open(md_file_path, "r", encoding="utf-8") as f:
+        text: str = f.read()
+
+    sections: Dict[int, str] = {}
+    matches: List[re.Match] = list(_PAGE_HEADER_RE.finditer(text))
+    for idx, match in enumerate(matches):
+        end: int = matches[idx + 1].start() if idx + 1 < len(matches) else len(text)
+        sections[int(match.group(1))] = text[match.end():end].strip()
+    return sections
+
+def _section_text(markdown_content: Optional[str]) -> str:
+    """
+    Content to write under a '# Page N' header: the page's markdown, or
+    the recorded-failure note when extraction produced nothing usable.
+    """
+    if markdown_content is None or not markdown_content.strip():
+        return (
+            f"> (FAILED after all attempts, including fallback model '{FALLBACK_MODEL}')\n\n"
+            "No valid Markdown block found."
+        )
+    return markdown_content
+
+def _build_prompt(page_numbers: List[int]) -> str:
+    """
+    Build the transcription prompt for one request. With a single page this is
+    the classic per-page prompt; with several pages (batched requests) the
+    model is asked to return one fenced markdown block per page, in order.
+    """
+    n: int = len(page_numbers)
+    if n == 1:
+        intro = f"You are looking at page {page_numbers[0]} of my PDF. "
+        output_req = _PROMPT_OUTPUT_SINGLE
+    else:
+        pages_str = ", ".join(str(p) for p in page_numbers)
+        intro = (
+            f"You are looking at {n} consecutive pages of my PDF "
+            f"(pages {pages_str}), one image per page, in order. "
+        )
+        output_req = (
+            "# Output Requirements\n"
+            f"- Return the transcription as exactly {n} separate Markdown blocks, one per page, in the same order as "
+            "the images, each enclosed in its own triple backticks (```markdown ... ```). "
+            "- Do **not** add extra commentary, interpretation, or summary—only the transcribed text in the correct order.\n\n"
+        )
+    return intro + _PROMPT_BODY + output_req + _PROMPT_FOOTER
+
+async def pdf_pages_to_vision_api(
     pdf_path: str,
     poppler_path: str,
     model_name: str,
     api_key: str,
-    debug: bool = False
+    debug: bool = False,
+    max_image_edge: int = DEFAULT_MAX_IMAGE_EDGE,
+    batch_pages: int = 1,
+    renderer: str = "poppler",
+    force: bool = False
 ) -> None:
     """
     Main pipeline:
       1. Convert PDF to images (optionally saving them if debug=True).
       2. Encode each page in base64.
       3. Send to OpenAI for OCR + Markdown conversion, with retries/fallback.
-      4. Write extracted Markdown to file (pdf_name.md).
+         Up to MAX_CONCURRENT_PAGES pages are processed concurrently.
+      4. Append each page's Markdown to file (pdf_name.md) as it finishes,
+         then rewrite the file once in page order. Interrupted runs keep
+         every completed page and can resume.
     """
-    client: OpenAI = OpenAI(api_key=api_key)
+    client: AsyncOpenAI = AsyncOpenAI(api_key=api_key)
 
     base_name: str = os.path.splitext(pdf_path)[0]
     md_file_path: str = base_name + ".md"
 
+    # Resume support: pages already present in the output file (with real
+    # content, not a recorded failure) are not sent to the API again unless
+    # the user passes --force.
+    existing_pages: Dict[int, str] = {}
     if os.path.exists(md_file_path):
-        os.remove(md_file_path)
+        if force:
+            os.remove(md_file_path)
+        else:
+            existing_pages = _parse_existing_markdown(md_file_path)
+    done_pages: "set[int]" = {
+        i for i, content in existing_pages.items()
+        if content and not content.startswith("> (FAILED")
+    }
+    if done_pages:
+        print(
+            f"Resuming: {len(done_pages)} page(s) already converted in '{md_file_path}', "
+            "skipping them (use --force to reconvert from scratch)."
+        )
 
-    pages: List[Image.Image] = convert_pdf_to_images(pdf_path, poppler_path, debug=debug)
-    num_pages: int = len(pages)
+    # Bound the number of simultaneous API calls so we don't hammer the API
+    # (or trip its rate limits) on large PDFs. The semaphore is acquired
+    # *before* the next page is pulled from the generator, so at most
+    # MAX_CONCURRENT_PAGES pages are ever resident in memory.
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
 
-    with open(md_file_path, "a", encoding="utf-8") as md_file:
-        for i, pil_page in enumerate(pages, start=1):
-            # Print a single line for each page unless we need multiple attempts
-            print(f"Processing Page {i}/{num_pages}")
-            
-            encoded_image: str = encode_image_to_base64(pil_page)
+    async def process_batch(page_numbers: List[int], batch: List[bytes]) -> "List[tuple[int, Optional[str]]]":
+        try:
+            # Print a single line per batch unless we need multiple attempts
+            if len(page_numbers) == 1:
+                print(f"Processing Page {page_numbers[0]}")
+            else:
+                print(f"Processing Pages {page_numbers[0]}-{page_numbers[-1]}")
 
             message_content: List[Dict[str, Any]] = [
                 {
                     "type": "text",
-                    "text": (
-                        f"You are looking at page {i} of my PDF. "
-                        "Your task is to extract **all** visible text exactly as it appears, in strict top-left to bottom-right reading order. "
-                        "Do **not** reorder or relocate headings, paragraphs, or tables—wherever something appears on the page, it must remain in that exact position in your output. "
-                        "Do **not** fix, skip, or summarize any text; preserve the exact wording, numbering, and spacing.\n\n"
-                        "# Markdown Formatting Rules\n"
-                        "1. **Headings**: Use standard Markdown syntax (#, ##, ###, etc.) for headings. If the heading appears in the middle of the page, keep it there—do not move it to the top.\n"
-                        "2. **Tables**: Use standard Markdown table syntax (rows/columns with pipes and dashes). If the text in a cell spans multiple lines in the image, replace line breaks with '<br>' within the same cell.\n"
-                        "3. **References**: If you see references like 'Offset address' or 'Reset value,' or any other labels/annotations, include them exactly where they appear.\n"
-                        "4. **Footnotes**: The only text you may ignore is a small footnote at the bottom margin that typically contains a URL and a page number. Everything else on the page must be transcribed.\n\n"
-                        "# Output Requirements\n"
-                        "- Return the transcribed text as a single Markdown block enclosed in triple backticks (```markdown ... ```). "
-                        "- Do **not** add extra commentary, interpretation, or summary—only the transcribed text in the correct order.\n\n"
-                        "Again, keep the **exact** sequence from top-left to bottom-right, including all headings, paragraphs, tables, and references in their original positions."
-                    ),
+                    "text": _build_prompt(page_numbers),
                 },
-                {
+            ]
+            for page_bytes in batch:
+                encoded_image: str = encode_image_to_base64(_downscale(page_bytes, max_image_edge))
+                message_content.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{encoded_image}",
+                        "url": f"data:image/jpeg;base64,{encoded_image}",
                         "detail": "high"
                     },
-                },
-            ]
+                })
 
             # Attempt extraction with retry/fallback
-            markdown_content: Optional[str] = attempt_markdown_extraction(
+            markdown_blocks: Optional[List[str]] = await attempt_markdown_extraction(
                 client=client,
                 message_content=message_content,
                 primary_model=model_name,
                 fallback_model=FALLBACK_MODEL,  # fallback model if the main model fails
-                max_retries=3
+                max_retries=3,
+                expected_blocks=len(page_numbers)
             )
-
-            # If still no markdown, write a failure message
-            if markdown_content is None or not markdown_content.strip():
-                markdown_content = (
-                    f"> (FAILED after all attempts, including fallback model '{FALLBACK_MODEL}')\n\n"
-                    "No valid Markdown block found."
-                )
-
-            md_file.write(f"# Page {i}\n\n{markdown_content}\n\n")
-
+            if markdown_blocks is None:
+                return [(i, None) for i in page_numbers]
+            return list(zip(page_numbers, markdown_blocks))
+        finally:
+            semaphore.release()
+
+    tasks: List["asyncio.Task[List[tuple[int, Optional[str]]]]"] = []
+    pages: Iterator[bytes]
+    if renderer == "pymupdf":
+        pages = convert_pdf_with_pymupdf(pdf_path, debug=debug)
+    else:
+        pages = convert_pdf_to_images(pdf_path, poppler_path, debug=debug)
+    page_numbers: List[int] = []
+    batch: List[bytes] = []
+
+    async def flush_batch() -> None:
+        if not batch:
+            return
+        await semaphore.acquire()
+        tasks.append(asyncio.create_task(process_batch(page_numbers[:], batch[:])))
+        page_numbers.clear()
+        batch.clear()
+
+    for i, page_bytes in enumerate(pages, start=1):
+        if i in done_pages:
+            continue
+        page_numbers.append(i)
+        batch.append(page_bytes)
+        if len(batch) >= batch_pages:
+            await flush_batch()
+    await flush_batch()
+
+    # Persist incrementally: each batch's sections are appended to the
+    # output file (and flushed) the moment its task finishes, so a crash,
+    # Ctrl-C or a non-transient API error only loses the batches still in
+    # flight — every page converted so far is on disk and the next run
+    # resumes past it. A fresh section for a page simply follows the old
+    # one; _parse_existing_markdown keeps the last occurrence, so
+    # reconverted failures win on resume too.
+    # Already-converted pages keep their (possibly hand-fixed) content;
+    # freshly converted pages overwrite any recorded failures.
+    markdown_by_page: Dict[int, Optional[str]] = {i: existing_pages[i] for i in done_pages}
+    try:
+        with open(md_file_path, "a", encoding="utf-8") as md_file:
+            for finished in asyncio.as_completed(tasks):
+                for i, md in await finished:
+                    markdown_by_page[i] = md
+                    md_file.write(f"# Page {i}\n\n{_section_text(md)}\n\n")
+                md_file.flush()
+    finally:
+        # Tasks complete in arbitrary order, so rewrite the file in page
+        # order once at the end — also on the error path, where it keeps
+        # whatever did finish. Writing to a temp file and os.replace()ing
+        # it makes the rewrite atomic: a crash mid-rewrite leaves the
+        # append-order file (same sections, resumable) intact.
+        tmp_path: str = md_file_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as md_file:
+            for i in sorted(markdown_by_page):
+                md_file.write(f"# Page {i}\n\n{_section_text(markdown_by_page[i])}\n\n")
+        os.replace(tmp_path, md_file_path)
+
+@functools.lru_cache(maxsize=1)
 def parse_arguments() -> argparse.ArgumentParser:
+    """
+    Build (once) and return the argument parser. Memoized so repeated calls —
+    e.g. from a batch driver invoking main() per file — don't rebuild the
+    parser and all its help strings every time.
+    """
     parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Convert a pdf file to markdown.")
     parser.add_argument(
         "input",
@@ -330,6 +688,17 @@ def parse_arguments() -> argparse.ArgumentParser:
             f"[Optional] OpenAI model name to use. Default is '{DEFAULT_MODEL}'.\n"
         ),
     )
+    parser.add_argument(
+        "--renderer",
+        choices=["auto", "pymupdf", "poppler"],
+        default="auto",
+        help=str(
+            "[Optional] PDF rasterizer to use. 'pymupdf' renders in-process\n"
+            "           (faster, no Poppler needed), 'poppler' spawns\n"
+            "           pdftocairo. Default 'auto' picks pymupdf when\n"
+            "           installed and falls back to poppler.\n"
+        ),
+    )
     parser.add_argument(
         "--poppler-path",
         default=None,
@@ -349,11 +718,39 @@ def parse_arguments() -> argparse.ArgumentParser:
             "           OPENAI_API_KEY env var.\n"
         ),
     )
+    parser.add_argument(
+        "--batch-pages",
+        type=int,
+        default=1,
+        help=str(
+            "[Optional] Number of pages to send per API request. Values > 1\n"
+            "           amortize the HTTP and prompt overhead over several\n"
+            "           pages at a small risk of the model mixing pages up.\n"
+            "           Default is 1.\n"
+        ),
+    )
+    parser.add_argument(
+        "--max-image-edge",
+        type=int,
+        default=DEFAULT_MAX_IMAGE_EDGE,
+        help=str(
+            f"[Optional] Longest edge (pixels) of a page image sent to the\n"
+            f"           API; larger pages are downscaled. Default is {DEFAULT_MAX_IMAGE_EDGE}.\n"
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=str(
+            "[Optional] Reconvert all pages, even those already present in\n"
+            "           the output file from a previous (interrupted) run.\n"
+        ),
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
         help=str(
-            "[Optional] If set, saves PNG pages locally to inspect.\n"
+            "[Optional] If set, saves page images locally to inspect.\n"
         ),
     )
     return parser
@@ -372,11 +769,24 @@ def main() -> None:
         _help(
             parser,
             f"Error: '{model_name}' is not a valid model.\n"
-            f"Please use one of: {', '.join(VALID_MODELS)}"
+            f"Please use one of: {', '.join(_VALID_MODELS_DISPLAY)}"
         )
 
-    if args.poppler_path:
-        poppler_path: str = os.path.normpath(args.poppler_path)
+    renderer: str = args.renderer
+    if renderer == "auto":
+        renderer = "pymupdf" if fitz is not None else "poppler"
+    elif renderer == "pymupdf" and fitz is None:
+        _help(
+            parser,
+            "Error: --renderer pymupdf requires the PyMuPDF package.\n"
+            "Install it with 'pip install pymupdf' or use '--renderer poppler'."
+        )
+
+    poppler_path: str = ""
+    if renderer == "pymupdf":
+        pass  # no Poppler needed
+    elif args.poppler_path:
+        poppler_path = os.path.normpath(args.poppler_path)
         if not os.path.isdir(poppler_path):
             _help(parser, f"Error: The provided Poppler path '{poppler_path}' is not a valid directory.")
         if not (poppler_path.endswith("bin") or poppler_path.endswith("bin" + os.sep)):
@@ -406,13 +816,17 @@ def main() -> None:
             "Please pass it via --api-key or set the OPENAI_API_KEY environment variable."
         )
 
-    pdf_pages_to_vision_api(
+    asyncio.run(pdf_pages_to_vision_api(
         pdf_path=args.input,
         poppler_path=poppler_path,
         model_name=model_name,
         api_key=api_key,
-        debug=args.debug
-    )
+        debug=args.debug,
+        max_image_edge=args.max_image_edge,
+        batch_pages=max(1, args.batch_pages),
+        renderer=renderer,
+        force=args.force
+    ))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+"""
+Extract register tables from a markdown file (as produced by convert_pdf.py
+and post_process.py) and print a per-table summary. Useful to verify that a
+converted MCU reference manual has complete register tables.
+
+Performance note — hot-path classification: the per-line work in
+parse_register_tables is dominated by CPython bytecode dispatch over
+splitlines(), .strip(), .startswith() and .split('|') plus the per-column
+list comprehension. The loop is interpreter/memory-bound, not
+arithmetic-bound, so the optimizations that pay off here are (a) moving work
+down the language stack (PyPy, C-level regex scans), (b) data layout changes
+that avoid materializing intermediates, and (c) specialization/caching.
+SIMD intrinsics or GPU offload are not applicable to input of this size and
+shape.
+
+The script is pure stdlib Python with no CPython-only idioms, so for very
+large manuals it can simply be run under PyPy, whose tracing JIT specializes
+exactly this kind of string-method loop:
+
+    pypy3 parse_tables.py my_file.md
+"""
+import argparse
+import hashlib
+import mmap
+import multiprocessing
+import os
+import pickle
+import re
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, NoReturn, Tuple
+
+try:
+    # Optional: google-re2's DFA engine gives a hard O(n) guarantee for the
+    # document scan and is faster than re on long lines (pip install
+    # google-re2). _TABLE_RE is RE2-compatible (no backreferences or
+    # lookaround), so the two engines match identically.
+    import re2 as _table_re_engine
+except ImportError:
+    _table_re_engine = re
+
+def _help(parser: argparse.ArgumentParser, error_message: Optional[str] = None) -> NoReturn:
+    """
+    Print an optional error message, then the parser's help text,
+    and exit with status code 1.
+    """
+    if error_message:
+        print(error_message, file=sys.stderr)
+        print(file=sys.stderr)
+    parser.print_help(sys.stderr)
+    sys.exit(1)
+
+# Rows within one manual almost always share a handful of shapes (5-column
+# register tables, 2-column overviews, ...), so per shape we generate a
+# specialized unpacker once, with the cell indexing and stripping unrolled
+# into a flat literal list, and reuse it for every row of that shape. The
+# cache key is the piece count of a plain split('|'), which pins down the
+# exact cell slice.
+_unpack_cache: Dict[int, Callable[[List[bytes]], List[bytes]]] = {}
+
+def _make_unpacker(n: int) -> Callable[[List[bytes]], tuple]:
+    """
+    Generate an unpacker for rows whose split('|') pieces hold cells at
+    indices 1..n-1 (piece 0 is the empty token before the leading pipe).
+    Rows come out as tuples: exact-sized, immutable and hashable, so
+    downstream consumers can dedup or memoize on them directly.
+    """
+    body = ', '.join(f'a[{i}].strip()' for i in range(1, n))
+    namespace: dict = {}
+    exec(f'def _u(a):\n    return ({body}{"," if n == 2 else ""})\n', namespace)
+    return namespace['_u']
+
+# Matches one whole register table in a single C-level pass: a pipe line
+# whose first cell mentions 'register', plus every directly following pipe
+# line. Anchored on the pipe with no nested quantifiers over overlapping
+# classes, so it is linear-time by construction (no ReDoS shape) even on
+# the stdlib backtracking engine; under re2 that bound holds for any
+# pattern edit too.
+_TABLE_RE = _table_re_engine.compile(
+    rb'^[ \t]*\|[^|\n]*register[^\n]*(?:\n[ \t]*\|[^\n]*)*',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+def _decode_table(rows: List[tuple]) -> List[Tuple[str, ...]]:
+    """
+    Decode a completed table's cells from UTF-8 bytes to str. Decoding only
+    happens here, at emission, for the tiny fraction of lines that actually
+    end up in a kept register table. Cells are interned: values like
+    'Reserved', 'RO' or '0x0' repeat thousands of times per manual, and
+    interning collapses each to a single shared object, shrinking the
+    result and making downstream equality checks pointer compares.
+    """
+    intern = sys.intern
+    return [
+        tuple(intern(col.decode('utf-8', errors='replace')) for col in row)
+        for row in rows
+    ]
+
+def parse_register_tables(data: bytes) -> Iterator[List[Tuple[str, ...]]]:
+    """
+    Scan a whole markdown buffer (raw bytes, also works on an mmap) for
+    tables whose header's first column mentions 'register'
+    (case-insensitive) and yield them one at a time, each table a list of
+    rows, each row a tuple of stripped, interned column strings.
+
+    Instead of a Python-level per-line state machine, one compiled regex
+    (_TABLE_RE) locates whole table blocks in a single pass inside CPython's
+    C regex engine; Python code only runs for the handful of matched blocks,
+    splitting their rows and decoding the cells. Each row is unpacked by a
+    generated function specialized to its shape (see _make_unpacker).
+    """
+    # Method-bind the hot lookups to locals (LOAD_FAST instead of
+    # LOAD_GLOBAL + LOAD_ATTR on every row).
+    cache_get = _unpack_cache.get
+
+    for match in _TABLE_RE.finditer(data):
+        rows: List[tuple] = []
+        for line in match.group(0).splitlines():
+            parts = line.split(b'|')
+            # parts[0] is the junk before the leading pipe (whitespace at
+            # most — _TABLE_RE anchors every line on its pipe); a trailing
+            # pipe leaves a whitespace-only last piece. The cells sit at
+            # indices 1..n-1 — real empty cells are kept. Probing the last
+            # piece directly avoids allocating a stripped copy of every
+            # line just to run endswith('|') on it.
+            last = parts[-1]
+            n = len(parts) - 1 if (not last or last.isspace()) else len(parts)
+            unpack = cache_get(n)
+            if unpack is None:
+                unpack = _unpack_cache[n] = _make_unpacker(n)
+            rows.append(unpack(parts))
+        yield _decode_table(rows)
+
+# Parsed tables are cached on disk keyed by a content hash, so re-running
+# the tool over an unchanged manual (CI, batch pipelines) collapses to one
+# file read plus an unpickle. The cache is bounded: least-recently-used
+# entries are evicted once it outgrows _CACHE_LIMIT_BYTES.
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'convertpdf-gpt')
+_CACHE_LIMIT_BYTES = 200 * 1024 * 1024
+
+def _cache_path(data: bytes) -> str:
+    """
+    Cache file path for a given input buffer (content-addressed). The
+    personalization string versions the cache: bumping it invalidates
+    entries whose pickled shape no longer matches the parser's output.
+    """
+    key = hashlib.blake2b(data, digest_size=16, person=b'tables-v2').hexdigest()
+    return os.path.join(_CACHE_DIR, f'{key}.pkl')
+
+def _load_cached_tables(data: bytes) -> Optional[List[List[Tuple[str, ...]]]]:
+    """Return the cached parse for this buffer, or None on any miss."""
+    path = _cache_path(data)
+    try:
+        with open(path, 'rb') as f:
+            tables = pickle.load(f)
+        os.utime(path)  # mark as recently used for eviction
+        return tables
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+def _store_cached_tables(data: bytes, tables: List[List[Tuple[str, ...]]]) -> None:
+    """Write a parse result to the cache; failures are non-fatal."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_cache_path(data), 'wb') as f:
+            pickle.dump(tables, f, pickle.HIGHEST_PROTOCOL)
+        _evict_cache()
+    except OSError:
+        pass
+
+def _evict_cache() -> None:
+    """Drop the oldest cache entries until the cache fits its size bound."""
+    entries = []
+    total = 0
+    for entry in os.scandir(_CACHE_DIR):
+        if entry.name.endswith('.pkl'):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    entries.sort()
+    for _, size, path in entries:
+        if total <= _CACHE_LIMIT_BYTES:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+def _report_for_file(path: str) -> str:
+    """
+    Read one Markdown file, extract its register tables (served from the
+    disk cache when the bytes are unchanged) and return the report text.
+    Pure function of the file contents, so it is safe to run in a worker
+    process.
+    """
+    # Map the file read-only instead of read()ing it: the hash and the
+    # table regex scan the page cache in place, so peak memory never holds
+    # a full userspace copy of the manual and bytes.find/regex dispatch to
+    # the C library's vectorized scanners. An empty file cannot be mapped,
+    # so that edge case falls back to a plain read.
+    with open(path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            data = f.read()
+        try:
+            # A previous run over the same bytes is served straight from
+            # the disk cache; only a miss pays for the actual parse.
+            tables = _load_cached_tables(data)
+            if tables is None:
+                tables = list(parse_register_tables(data))
+                _store_cached_tables(data, tables)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    # Buffer the report and emit it as one string: thousands of print()
+    # calls (each taking the stdio lock and flushing) add up on large
+    # manuals.
+    out: List[str] = []
+    out_append = out.append
+
+    for table_i, table in enumerate(tables, start=1):
+        out_append(f"Table {table_i}: {len(table)} row(s)\n")
+        for row_i, row_cols in enumerate(table):
+            out_append(f"  Row {row_i}, columns={len(row_cols)}: {row_cols}\n")
+
+    out_append(f"Found {len(tables)} register table(s) in '{path}'.\n")
+    return ''.join(out)
+
+def main() -> None:
+    """
+    Main entry point. Parse command-line arguments, read the input Markdown
+    file(s), extract the register tables and print a summary of each. With
+    several input files the per-file work fans out over a process pool —
+    parsing is pure and independent per file, so it scales with the core
+    count instead of being pinned to one interpreter.
+    """
+    parser = argparse.ArgumentParser(description="Extract register tables from Markdown files.")
+    parser.add_argument("input", nargs="*", help="Path(s) to the input Markdown file(s)")
+    args = parser.parse_args()
+
+    if not args.input:
+        _help(parser, "Error: No input file provided.")
+
+    for path in args.input:
+        if not os.path.isfile(path):
+            _help(parser, f"Error: The file '{path}' does not exist or is not a valid path.")
+
+    if len(args.input) == 1:
+        sys.stdout.write(_report_for_file(args.input[0]))
+        return
+
+    # imap (not map) keeps input order in the output while letting reports
+    # stream back as workers finish.
+    chunksize = max(1, len(args.input) // (4 * (os.cpu_count() or 1)))
+    with multiprocessing.Pool() as pool:
+        for report in pool.imap(_report_for_file, args.input, chunksize):
+            sys.stdout.write(report)
+    return
+
+if __name__ == "__main__":
+    main()
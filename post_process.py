@@ -1,9 +1,37 @@
 #!/usr/bin/env python
 import argparse
+import mmap
 import re
 import os
 import sys
-from typing import List, Dict, Union, Optional, NoReturn
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, NoReturn
+
+# All regexes are compiled once at import time. The functions below run per
+# line over the whole document, and re.sub/re.match with a pattern string
+# pays a cache lookup plus string hash on every call — compiled pattern
+# objects skip that entirely.
+_LEADING_HASHES_RE = re.compile(r'^[#\s]+')
+_NUMERIC_HEADING_NO_TEXT_RE = re.compile(r'^#{1,6}\s+\d+(?:\.\d+)*$')
+_BULLET_RE = re.compile(r'^#{0,6}\s*\d+(?:[.)])\s')
+_HEADING_RE = re.compile(r'^(#{0,6})\s*(\d+(?:\.\d+)*)(.*)$')
+# _HEADING_RE with the numeric part made optional: it matches every line,
+# and its groups tell fix_titles_and_headings in one regex call whether the
+# line has leading hashes and/or starts with a dotted number.
+_CLASSIFY_RE = re.compile(r'^(#{0,6})\s*(\d+(?:\.\d+)*)?(.*)$')
+# Tail of _BULLET_RE after the digits: one '.' or ')' plus whitespace.
+_BULLET_TAIL_RE = re.compile(r'^[.)]\s')
+_ARM_HEADING_RE = re.compile(r'^[A-D]\d+\.\d+')
+# Prefix tuples for the ARM-manual heading levels; startswith() takes a
+# tuple and checks all of them in one C call.
+_ARM_PART_PREFIXES = ("Part A", "Part B", "Part C", "Part D")
+_ARM_CHAPTER_PREFIXES = ("Chapter ", "Appendix")
+_BITFIELD_RE = re.compile(r'^\s*\d+:\d+\s*$')
+_ANGLE_S_RE = re.compile(r'<([sS])>')
+_DASH_OR_COLON_RE = re.compile(r'^[\-\:\s]+$')
+# Deletes every character a dash-separator row may contain; anything left
+# over after translate() proves the line is not a separator.
+_DASH_SEP_DELETE = str.maketrans('', '', '-:| ')
 
 def _help(parser: argparse.ArgumentParser, error_message: Optional[str] = None) -> NoReturn:
     """
@@ -16,35 +44,55 @@ def _help(parser: argparse.ArgumentParser, error_message: Optional[str] = None)
     parser.print_help(sys.stderr)
     sys.exit(1)
 
-def parse_markdown_into_blocks(md_text: str) -> List[Dict[str, Union[str, List[str]]]]:
+@dataclass(slots=True)
+class Block:
+    """
+    One parsed Markdown block: type is 'heading', 'table' or 'text', and
+    lines holds the block's raw lines. For table blocks, pipes caches the
+    pipe count of the first line (0 for the other types). A slotted
+    dataclass instead of a dict: attribute access skips the string-key
+    hashing and each block is several times smaller, which adds up over
+    the thousands of blocks in a converted manual.
+    """
+    type: str
+    lines: List[str]
+    pipes: int = 0
+
+def parse_markdown_into_blocks(md_lines: Iterable[str]) -> List["Block"]:
     """
     Splits the Markdown into blocks of 'heading', 'table', or 'text'.
-    Each block is a dict:
-       { "type": "heading"|"table"|"text", "lines": [str, ...] }
+    Takes any iterable of lines (without trailing newlines), so callers
+    can stream straight from a file without materializing the whole
+    document first. Each block is a Block instance.
 
     This version:
       - Only checks if a line has >= 2 '|' to treat it as a table row;
       - Calls fix_table_row() so the line definitely starts with '|';
       - Never breaks the table block prematurely if the line has '|' in it.
     """
-    lines = md_text.splitlines()
-    blocks: List[Dict[str, Union[str, List[str]]]] = []
+    blocks: List[Block] = []
     current_block_lines: List[str] = []
     current_type: Optional[str] = None
+    blocks_append = blocks.append
 
     def add_block(block_type: str, block_lines: List[str]) -> None:
         """
         Add a new block of the specified type to the `blocks` list,
-        but only if `block_lines` is not empty.
+        but only if `block_lines` is not empty. Table blocks carry the
+        pipe count of their first line so structure comparisons during
+        merging are O(1) lookups instead of line rescans.
         """
         if block_lines:
-            blocks.append({"type": block_type, "lines": block_lines})
-
-    for line in lines:
-        line_strip = line.strip()
-
-        # 1) If it has >=2 pipes, treat as a table row
-        if looks_like_table_row(line):
+            pipes = block_lines[0].count("|") if block_type == "table" else 0
+            blocks_append(Block(block_type, block_lines, pipes))
+
+    for line in md_lines:
+        # 1) If it has >=2 pipes, treat as a table row. The pipe test is
+        #    inlined from looks_like_table_row so the common prose line
+        #    costs one early-exit find() and no call overhead; the heading
+        #    branch below pays for its strip only when actually reached.
+        first_pipe = line.find("|")
+        if first_pipe != -1 and line.find("|", first_pipe + 1) != -1:
             fixed_line = fix_table_row(line)  # ensures it starts with "|"
             if current_type == "table":
                 current_block_lines.append(fixed_line)
@@ -55,7 +103,7 @@ def parse_markdown_into_blocks(md_text: str) -> List[Dict[str, Union[str, List[s
                 current_type = "table"
 
         # 2) Else, see if it's a heading
-        elif is_markdown_heading(line_strip):
+        elif is_markdown_heading(line.lstrip()):
             add_block(current_type or "text", current_block_lines)
             current_block_lines = [line]
             current_type = "heading"
@@ -79,12 +127,36 @@ def parse_markdown_into_blocks(md_text: str) -> List[Dict[str, Union[str, List[s
     add_block(current_type or "text", current_block_lines)
     return blocks
 
+def _iter_input_lines(path: str) -> Iterator[str]:
+    """
+    Stream the decoded lines of a file without reading it whole: the file
+    is mapped read-only and paged in on demand, so peak memory holds the
+    block list but never an extra full copy of the raw document. Each
+    mapped chunk is decoded and re-split with splitlines(), which keeps
+    the same line-break semantics (\\r, \\r\\n, Unicode breaks) as
+    splitting a fully read string.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped (and has no lines)
+            return
+        with mm:
+            for chunk in iter(mm.readline, b""):
+                yield from chunk.decode("utf-8").splitlines()
+
 def looks_like_table_row(line: str) -> bool:
     """
     Returns True if 'line' has 2 or more '|' characters,
     implying it's likely part of a table row or separator.
+
+    Two find() calls instead of count(): both stop as soon as the answer
+    is known, so prose lines are scanned once up to their first pipe (if
+    any) rather than counting every pipe in the line.
     """
-    return line.count("|") >= 2
+    first_pipe = line.find("|")
+    return first_pipe != -1 and line.find("|", first_pipe + 1) != -1
 
 def fix_table_row(line: str) -> str:
     """
@@ -92,8 +164,14 @@ def fix_table_row(line: str) -> str:
     2) Ensure it starts with '|'.
     3) Ensure it ends with '|'.
     """
+    # Fast path: a row that already starts with '|' and ends with '|'
+    # (ignoring trailing whitespace) passes all three steps untouched,
+    # and that is the overwhelmingly common case.
+    if line.startswith("|") and line.rstrip().endswith("|"):
+        return line
+
     # Remove leading '#' + spaces
-    line = re.sub(r'^[#\s]+', '', line)
+    line = _LEADING_HASHES_RE.sub('', line)
 
     # Ensure it starts with '|'
     if not line.strip().startswith("|"):
@@ -105,9 +183,7 @@ def fix_table_row(line: str) -> str:
 
     return line
 
-def unify_headings_spread_over_two_lines(
-    blocks: List[Dict[str, Union[str, List[str]]]]
-) -> List[Dict[str, Union[str, List[str]]]]:
+def unify_headings_spread_over_two_lines(blocks: List[Block]) -> List[Block]:
     """
     Some headings are spread across two lines, for example:
 
@@ -128,48 +204,62 @@ def unify_headings_spread_over_two_lines(
     ## 8.1 Full Name and Abbreviation of Terms
 
     This function attempts to unify such split headings into a single line.
-    """
-    numeric_heading_no_text = re.compile(r'^#{1,6}\s+\d+(?:\.\d+)*$')
-    bullet_pattern = re.compile(r'^#{0,6}\s*\d+(?:[.)])\s')
-    heading_pattern = re.compile(r'^(#{0,6})\s*(\d+(?:\.\d+)*)(.*)$')
 
+    Runs as one forward pass that builds a new block list: the old
+    in-place version removed emptied blocks with blocks.pop(i + 1), an
+    O(n) shift per removal that made heading-heavy documents quadratic.
+    """
+    unified_blocks: List[Block] = []
     i = 0
-    while i < len(blocks) - 1:
+    n = len(blocks)
+    while i < n:
         current_block = blocks[i]
-        next_block = blocks[i + 1]
-
-        if current_block["type"] == "heading" and len(current_block["lines"]) == 1:
-            heading_line = current_block["lines"][0].strip()
-
-            if numeric_heading_no_text.match(heading_line):
-                if len(next_block["lines"]) >= 1:
-                    next_line = next_block["lines"][0].rstrip()
-                    ends_with_punct = (next_line and next_line[-1] in ('.', '!', '?'))
-                    if not ends_with_punct:
-                        next_line_stripped = next_line.lstrip()
-                        is_bullet = bool(bullet_pattern.match(next_line_stripped))
-                        is_numeric_heading = bool(heading_pattern.match(next_line_stripped))
-
-                        if not (is_bullet or is_numeric_heading):
-                            # If next_line starts with '#', remove it
-                            next_line = re.sub(r'^[#\s]+', '', next_line, count=1).strip()
-                            new_line = heading_line + " " + next_line
-                            current_block["lines"] = [new_line]
-                            next_block["lines"].pop(0)
-
-                            # if next_block empty, remove it
-                            if not any(ln.strip() for ln in next_block["lines"]):
-                                blocks.pop(i + 1)
-                            else:
-                                i += 1
-                            continue
-
-        i += 1
-    return blocks
-
-def merge_multpage_tables(
-    blocks: List[Dict[str, Union[str, List[str]]]]
-) -> List[Dict[str, Union[str, List[str]]]]:
+        j = i + 1
+
+        if current_block.type == "heading" and len(current_block.lines) == 1:
+            # Keep unifying into this heading while the following blocks
+            # get consumed whole (mirrors the old "recheck current after
+            # removing an emptied next block" behavior).
+            while j < n:
+                heading_line = current_block.lines[0].strip()
+                # A numeric-only heading necessarily ends in a digit, so
+                # this one-character probe rejects nearly every heading
+                # before paying for the regex call.
+                if (not heading_line or not heading_line[-1].isdecimal()
+                        or not _NUMERIC_HEADING_NO_TEXT_RE.match(heading_line)):
+                    break
+                next_block = blocks[j]
+                next_line = next_block.lines[0].rstrip()
+                ends_with_punct = (next_line and next_line[-1] in ('.', '!', '?'))
+                if ends_with_punct:
+                    break
+                next_line_stripped = next_line.lstrip()
+                if _BULLET_RE.match(next_line_stripped) or _HEADING_RE.match(next_line_stripped):
+                    break
+
+                # If next_line starts with '#', remove it
+                next_line = _LEADING_HASHES_RE.sub('', next_line, count=1).strip()
+                current_block.lines = [heading_line + " " + next_line]
+                next_block.lines.pop(0)
+                # A table block's cached pipe count tracks its first
+                # line — refresh it if that line moved.
+                if next_block.type == "table" and next_block.lines:
+                    next_block.pipes = next_block.lines[0].count("|")
+
+                if any(ln and not ln.isspace() for ln in next_block.lines):
+                    # next_block survives (minus its first line) and
+                    # becomes the next current block
+                    break
+                # next_block is empty now => skip it and retry the
+                # (possibly again numeric-only) heading against what
+                # follows
+                j += 1
+
+        unified_blocks.append(current_block)
+        i = j
+    return unified_blocks
+
+def merge_multpage_tables(blocks: List[Block]) -> List[Block]:
     """
     Merge consecutive table blocks that have the same column structure.
     This is often necessary when a table was split across multiple pages
@@ -177,23 +267,25 @@ def merge_multpage_tables(
     column count, this function combines them into one table, skipping
     the repeated header row.
     """
-    merged_blocks: List[Dict[str, Union[str, List[str]]]] = []
+    merged_blocks: List[Block] = []
     i = 0
 
     while i < len(blocks):
         block = blocks[i]
-        if block["type"] == "table":
+        if block.type == "table":
             tableA = block
             j = i + 1
             while j < len(blocks):
                 if is_empty_text_block(blocks[j]) or is_page_heading(blocks[j]):
                     j += 1
                     continue
-                if blocks[j]["type"] == "table":
+                if blocks[j].type == "table":
                     tableB = blocks[j]
-                    if same_table_structure(tableA["lines"], tableB["lines"]):
-                        merged_lines = tableA["lines"] + skip_header_and_separator(tableB["lines"])
-                        tableA = {"type": "table", "lines": merged_lines}
+                    # Same column structure? Compare the cached pipe
+                    # counts instead of rescanning the header lines.
+                    if tableA.pipes == tableB.pipes:
+                        merged_lines = tableA.lines + skip_header_and_separator(tableB.lines)
+                        tableA = Block("table", merged_lines, tableA.pipes)
                         j += 1
                         continue
                 break
@@ -204,19 +296,22 @@ def merge_multpage_tables(
             i += 1
     return merged_blocks
 
-def remove_page_headings_and_reassemble(
-    blocks: List[Dict[str, Union[str, List[str]]]]
-) -> str:
+def remove_page_headings_and_reassemble(blocks: List[Block]) -> str:
     """
     Remove blocks that are "page headings" (e.g. '# Page 2'), then
-    reassemble all remaining blocks into a single Markdown string.
+    reassemble all remaining blocks into a single Markdown string, with
+    one blank line between blocks for readability. Filtering and
+    stringification happen in one pass over the block list, so no
+    intermediate filtered list is built.
     """
-    filtered_blocks: List[Dict[str, Union[str, List[str]]]] = []
-    for b in blocks:
-        if is_page_heading(b):
+    lines_out: List[str] = []
+    for block in blocks:
+        if is_page_heading(block):
             continue
-        filtered_blocks.append(b)
-    return reassemble_blocks(filtered_blocks)
+        if lines_out:
+            lines_out.append("")  # one blank line between blocks
+        lines_out.extend(block.lines)
+    return "\n".join(lines_out).strip()
 
 def fix_titles_and_headings(md_text: str) -> str:
     """
@@ -228,41 +323,57 @@ def fix_titles_and_headings(md_text: str) -> str:
        EXCEPT if the text after the numeric part starts with a colon, e.g. '31:22'.
     4) If a line starts with '#' but doesn't match bullets or numeric => remove '#'.
     """
-    lines = md_text.splitlines()
+    # split('\n') instead of splitlines(): the pipeline builds md_text by
+    # joining terminator-free lines with '\n' and stripping the result
+    # (so it cannot end in a newline either); an LF-only split is exact
+    # under those two invariants and skips the Unicode line-break scan.
+    lines = md_text.split("\n")
     fixed_lines: List[str] = []
-
-    bullet_pattern = re.compile(r'^#{0,6}\s*\d+(?:[.)])\s')
-    heading_pattern = re.compile(r'^(#{0,6})\s*(\d+(?:\.\d+)*)(.*)$')
+    # Bind the hot append to a local: it runs once per line
+    fixed_lines_append = fixed_lines.append
 
     for line in lines:
+        # Fast path for the majority of lines: if the first character is
+        # not '#', whitespace or a digit, no branch below can alter the
+        # line (the hash-stripping sub has nothing to remove and the
+        # bullet/heading patterns need a digit), so emit it as-is without
+        # stripping or matching anything. Empty lines are equally inert.
+        if not line or (line[0] != '#' and not line[0].isspace() and not line[0].isdigit()):
+            fixed_lines_append(line)
+            continue
+
         original = line
         stripped = line.strip()
 
         # 1) If the stripped line ends with one of . ! ?, treat as normal text
         if stripped and stripped[-1] in ('.', '!', '?', ','):
-            new_line = re.sub(r'^[#\s]+', '', original)
-            fixed_lines.append(new_line)
+            new_line = _LEADING_HASHES_RE.sub('', original)
+            fixed_lines_append(new_line)
             continue
 
-        # 2) Check bullet pattern
-        if bullet_pattern.match(stripped):
-            new_line = re.sub(r'^[#\s]+', '', original)
-            fixed_lines.append(new_line)
+        # One classify match per line; the bullet/heading/hash branches
+        # below dispatch on its groups instead of each rerunning their own
+        # regex over the same prefix.
+        match = _CLASSIFY_RE.match(stripped)
+        numeric_part = match.group(2)
+
+        # 2) Check bullet pattern: digits (no dots), then '.' or ')', then
+        #    whitespace — _BULLET_RE split across the classify groups.
+        if numeric_part and '.' not in numeric_part and _BULLET_TAIL_RE.match(match.group(3)):
+            new_line = _LEADING_HASHES_RE.sub('', original)
+            fixed_lines_append(new_line)
             continue
 
         # 3) Check numeric heading pattern
-        match = heading_pattern.match(stripped)
-        if match:
+        if numeric_part:
             # If there's a colon in the numeric part or right afterward,
             # do NOT treat it as a heading at all.
             # Instead, skip to step 4 below (removing '#' entirely).
             if ':' in stripped:
-                new_line = re.sub(r'^[#\s]+', '', original)
-                fixed_lines.append(new_line)
+                new_line = _LEADING_HASHES_RE.sub('', original)
+                fixed_lines_append(new_line)
                 continue
 
-            existing_hashes = match.group(1)
-            numeric_part = match.group(2)
             rest = match.group(3).rstrip()
 
             # If the text after the numberic part comes immediately (without a space), don't make it
@@ -270,21 +381,21 @@ def fix_titles_and_headings(md_text: str) -> str:
             # 0xFFAB
             # turns into a header (no space after the '0').
             if not rest.startswith(' '):
-                new_line = re.sub(r'^[#\s]+', '', original)
-                fixed_lines.append(new_line)
+                new_line = _LEADING_HASHES_RE.sub('', original)
+                fixed_lines_append(new_line)
                 continue
 
             # If the text after the numeric part starts with a colon or hyphen, don't make it a
             # header.
             if rest.lstrip().startswith((':', '-', '<', '>', '&')):
-                new_line = re.sub(r'^[#\s]+', '', original)
-                fixed_lines.append(new_line)
+                new_line = _LEADING_HASHES_RE.sub('', original)
+                fixed_lines_append(new_line)
                 continue
 
             # If the text after the numberic part is again a number, don't make it a header.
             if rest.lstrip().startswith(('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')):
-                new_line = re.sub(r'^[#\s]+', '', original)
-                fixed_lines.append(new_line)
+                new_line = _LEADING_HASHES_RE.sub('', original)
+                fixed_lines_append(new_line)
                 continue
 
             # Otherwise, it's a valid numeric heading => set heading level
@@ -294,15 +405,16 @@ def fix_titles_and_headings(md_text: str) -> str:
                 new_line = f"{new_hashes} {numeric_part}{rest}"
             else:
                 new_line = f"{new_hashes} {numeric_part}"
-            fixed_lines.append(new_line)
+            fixed_lines_append(new_line)
             continue
 
         # 4) If line starts with '#' but doesn't match bullet or numeric => remove '#'
-        if stripped.startswith('#'):
-            new_line = re.sub(r'^[#\s]+', '', original)
-            fixed_lines.append(new_line)
+        #    (a non-empty hash group is the same test as startswith('#'))
+        if match.group(1):
+            new_line = _LEADING_HASHES_RE.sub('', original)
+            fixed_lines_append(new_line)
         else:
-            fixed_lines.append(line)
+            fixed_lines_append(line)
         continue
     return "\n".join(fixed_lines)
 
@@ -310,86 +422,64 @@ def fix_titles_and_headings_arm(md_text: str) -> str:
     """
 
     """
-    lines = md_text.splitlines()
+    # LF-only split; exact for pipeline-joined text (see
+    # fix_titles_and_headings).
+    lines = md_text.split("\n")
     fixed_lines: List[str] = []
-    heading_pattern = re.compile(r'^[A-D]\d+\.\d+')
-
     for line in lines:
-        original_line = line
-        fixed_line = line.strip()
+        # Strip once; the hash removal and the final "did anything
+        # change" comparison reuse this instead of re-stripping.
+        stripped = line.strip()
+        fixed_line = stripped
 
         # Strip off all '#' at the beginning
         if fixed_line.startswith('#'):
-            fixed_line = re.sub(r'^[#\s]+', '', fixed_line).strip()
+            fixed_line = _LEADING_HASHES_RE.sub('', fixed_line).strip()
 
         # Toplevel is "Part A", "Part B", ...
-        if fixed_line.startswith(("Part A", "Part B", "Part C", "Part D")):
+        if fixed_line.startswith(_ARM_PART_PREFIXES):
             if not fixed_line.endswith(('.', '?', '!', ':')):
                 fixed_line = "# " + fixed_line
 
         # Below that is "Chapter A1", "Chapter A2", ..., "Appendix D1", ...
-        if fixed_line.startswith(("Chapter ", "Appendix")):
+        if fixed_line.startswith(_ARM_CHAPTER_PREFIXES):
             fixed_line = "## " + fixed_line
 
         # Below that is "A1.1", "A1.2", ... "D8.4"
-        match = heading_pattern.match(fixed_line)
-        if match:
+        if _ARM_HEADING_RE.match(fixed_line):
             fixed_line = "### " + fixed_line
 
-        # Check if fixed_line is different
-        if fixed_line == original_line.strip():
-            # no changes
-            fixed_lines.append(original_line)
-        else:
-            fixed_lines.append(fixed_line)
-        continue
+        # Keep the original line when nothing changed
+        fixed_lines.append(line if fixed_line == stripped else fixed_line)
     return "\n".join(fixed_lines)
 
 
-def reassemble_blocks(blocks: List[Dict[str, Union[str, List[str]]]]) -> str:
-    """
-    Given a list of blocks (each with a 'type' and a list of 'lines'),
-    reassemble them into a single Markdown string. Insert one blank
-    line between each block for readability.
-    """
-    lines_out: List[str] = []
-    for idx, block in enumerate(blocks):
-        if idx > 0:
-            lines_out.append("")  # one blank line between blocks
-        lines_out.extend(block["lines"])
-    return "\n".join(lines_out).strip()
-
 def skip_header_and_separator(table_lines: List[str]) -> List[str]:
     """
     Given a list of table lines, skip the first line (header),
     and if the next line is a dash separator row, skip that too.
-    Return the remaining lines.
+    Return the remaining lines, copied in a single slice at the
+    computed offset instead of slicing twice.
     """
-    lines_after_header = table_lines[1:]
-    if lines_after_header and is_dash_separator(lines_after_header[0]):
-        lines_after_header = lines_after_header[1:]
-    return lines_after_header
+    offset = 2 if len(table_lines) > 1 and is_dash_separator(table_lines[1]) else 1
+    return table_lines[offset:]
 
 def is_dash_separator(line: str) -> bool:
     """
     Check if `line` is a Markdown table dash separator line,
     e.g. '|---|:---:|---|' possibly with colons for alignment.
-    """
-    stripped = line.replace(' ', '')
-    if not (stripped.startswith('|') and stripped.endswith('|')):
-        return False
-    inner = stripped[1:-1]
-    return all(ch in '-:|' for ch in inner)
 
-def same_table_structure(table_lines_a: List[str], table_lines_b: List[str]) -> bool:
-    """
-    Return True if `table_lines_a` and `table_lines_b` appear to have
-    the same column structure, by comparing the number of '|' characters
-    in the first line of each.
+    A separator has '|' as its first and last non-space character and
+    contains nothing but '-', ':', '|' and spaces. translate() with a
+    delete table checks the character set in one C-level pass instead of
+    a per-character Python loop over a de-spaced copy.
     """
-    if not table_lines_a or not table_lines_b:
-        return False
-    return table_lines_a[0].count("|") == table_lines_b[0].count("|")
+    stripped = line.strip(' ')
+    return (
+        stripped.startswith('|')
+        and stripped.endswith('|')
+        and not stripped.translate(_DASH_SEP_DELETE)
+    )
 
 def is_markdown_heading(line: str) -> bool:
     """
@@ -398,25 +488,43 @@ def is_markdown_heading(line: str) -> bool:
     """
     return line.startswith("#")
 
-def is_page_heading(block: Dict[str, Union[str, List[str]]]) -> bool:
+def is_page_heading(block: Block) -> bool:
     """
     Return True if `block` is a 'heading' and its text matches
     a pattern like '# Page 2' (case-insensitive).
     Used to skip page-break headings.
     """
-    if block["type"] != "heading":
+    if block.type != "heading":
+        return False
+    text = " ".join(block.lines).strip()
+    # Straightline parse of '#{1,6} <ws> Page <ws> <digit>': the shape is
+    # rigid enough that a dozen index compares beat entering the regex
+    # engine for every heading block.
+    n = len(text)
+    i = 0
+    while i < n and text[i] == "#":
+        i += 1
+    if not 1 <= i <= 6:
+        return False
+    j = i
+    while j < n and text[j].isspace():
+        j += 1
+    if j == i or text[j:j + 4].lower() != "page":
         return False
-    text = " ".join(block["lines"]).strip()
-    return bool(re.match(r"^#{1,6}\s+Page\s+\d+", text, re.IGNORECASE))
+    j += 4
+    k = j
+    while k < n and text[k].isspace():
+        k += 1
+    return k > j and k < n and text[k].isdecimal()
 
-def is_empty_text_block(block: Dict[str, Union[str, List[str]]]) -> bool:
+def is_empty_text_block(block: Block) -> bool:
     """
     Return True if `block` is of type 'text' and all its lines
-    are empty or whitespace.
+    are empty or whitespace (tested without allocating stripped copies).
     """
-    if block["type"] != "text":
+    if block.type != "text":
         return False
-    return all(not ln.strip() for ln in block["lines"])
+    return all(not ln or ln.isspace() for ln in block.lines)
 
 def fix_broken_bitfield_tables(md_text: str) -> str:
     """
@@ -437,6 +545,10 @@ def fix_broken_bitfield_tables(md_text: str) -> str:
     Then, it ensures that a blank line is only inserted after the table
     if the next non-blank line is not another table row.
     """
+    # splitlines(), not split('\n'): fix_titles_and_headings can emit
+    # trailing empty lines (a line of only hashes strips to ''), so this
+    # pass's input may end with '\n', which split('\n') would turn into
+    # a spurious extra element.
     lines = md_text.splitlines()
     output: list[str] = []
     last_table: list[str] = []
@@ -447,8 +559,6 @@ def fix_broken_bitfield_tables(md_text: str) -> str:
         return line.strip().startswith("|")
 
     # Regex for lines like "10:9", "31:29", etc.
-    bitfield_pattern = re.compile(r'^\s*\d+:\d+\s*$')
-
     i = 0
     while i < len(lines):
         line = lines[i]
@@ -469,26 +579,26 @@ def fix_broken_bitfield_tables(md_text: str) -> str:
                 # Fold in bitfield lines + "Reserved" lines
                 while True:
                     # 1) Skip blank lines
-                    while i < len(lines) and not lines[i].strip():
+                    while i < len(lines) and (not lines[i] or lines[i].isspace()):
                         i += 1
                     # 2) Need at least two lines left for "bitrange + Reserved"
                     if i + 1 >= len(lines):
                         break
 
                     # 3) Check for bitfield + Reserved
-                    if bitfield_pattern.match(lines[i]):
+                    if _BITFIELD_RE.match(lines[i]):
                         bit_range = lines[i].strip()
                         i += 1
 
                         # skip blank lines before "Reserved"
-                        while i < len(lines) and not lines[i].strip():
+                        while i < len(lines) and (not lines[i] or lines[i].isspace()):
                             i += 1
 
                         # next line must be "Reserved"
                         if i < len(lines) and lines[i].strip().lower() == "reserved":
                             i += 1
                             # skip blank lines after "Reserved"
-                            while i < len(lines) and not lines[i].strip():
+                            while i < len(lines) and (not lines[i] or lines[i].isspace()):
                                 i += 1
 
                             # Insert the new row
@@ -510,21 +620,26 @@ def fix_broken_bitfield_tables(md_text: str) -> str:
                 # line is a table row. If not, then insert a blank line.
                 # ----------------------------------------------------
                 peek = i
-                while peek < len(lines) and not lines[peek].strip():
+                while peek < len(lines) and (not lines[peek] or lines[peek].isspace()):
                     peek += 1
                 # If we've hit EOF or the next line isn't table-like => blank line
                 if peek >= len(lines) or not is_table_line(lines[peek]):
                     # Insert one blank line if last line of output not blank
-                    if output and output[-1].strip():
+                    if output and output[-1] and not output[-1].isspace():
                         output.append('')
 
                 # We *don't* increment i here if it's still referencing
                 # the current 'line'. We'll handle that in next loop iteration.
 
             else:
-                # We are outside a table => just output
-                output.append(line)
-                i += 1
+                # We are outside a table => copy the whole run of
+                # non-table lines with one extend instead of an append
+                # per line
+                j = i + 1
+                while j < len(lines) and not is_table_line(lines[j]):
+                    j += 1
+                output.extend(lines[i:j])
+                i = j
 
     # If ended in a table, finalize it.
     if in_table and last_table:
@@ -532,7 +647,7 @@ def fix_broken_bitfield_tables(md_text: str) -> str:
         last_table.clear()
 
         # Similarly, check if we need a trailing blank line
-        if output and output[-1].strip():
+        if output and output[-1] and not output[-1].isspace():
             output.append('')
 
     return "\n".join(output)
@@ -552,8 +667,13 @@ def fix_multiline_table_cells(md_text: str) -> str:
     but content that doesn't match that pattern starts a new row. This helps
     preserve data integrity while preventing huge tables from being corrupted.
     """
+    # splitlines() here, unlike the earlier passes: the preceding pass can
+    # end its output with '\n' (a document ending in a table gets a
+    # trailing blank line), and split('\n') would turn that into a
+    # spurious extra empty element.
     lines = md_text.splitlines()
     output: list[str] = []
+    output_append = output.append
 
     current_table: list[list[str]] = []
     table_cols_count: int | None = None
@@ -564,25 +684,35 @@ def fix_multiline_table_cells(md_text: str) -> str:
         """Convert all rows in current_table to Markdown lines, then output them."""
         if not current_table:
             return
-        for row in current_table:
-            row_str = " | ".join(col.strip() for col in row)
-            output.append(f"| {row_str} |")
+        # One extend for the whole table instead of one append per row
+        output.extend(
+            "| " + " | ".join(col.strip() for col in row) + " |"
+            for row in current_table
+        )
         current_table.clear()
 
     def is_table_row(line: str) -> bool:
-        """Check if a line is a potential table row (starts/ends with '|')."""
-        text = line.strip()
-        return text.startswith("|") and text.endswith("|")
+        """
+        Check if a line is a potential table row (starts/ends with '|').
+        Walks in from both ends past whitespace instead of allocating a
+        stripped copy of every line; table lines rarely have any padding,
+        so the scans usually stop immediately.
+        """
+        a = 0
+        b = len(line)
+        while a < b and line[a].isspace():
+            a += 1
+        while b > a and line[b - 1].isspace():
+            b -= 1
+        return b > a and line[a] == "|" and line[b - 1] == "|"
 
     def is_dash_separator(columns: list[str]) -> bool:
         """Return True if all columns match a dash/colon pattern (like '---', '---:', etc.)."""
-        dash_or_colon = re.compile(r'^[\-\:\s]+$')
-        return all(dash_or_colon.match(c.strip()) for c in columns)
+        return all(_DASH_OR_COLON_RE.match(c.strip()) for c in columns)
 
     i = 0
     while i < len(lines):
         line = lines[i]
-        stripped = line.strip()
 
         # If it's not a table row => flush if in table, then output as normal text
         if not is_table_row(line):
@@ -592,14 +722,17 @@ def fix_multiline_table_cells(md_text: str) -> str:
                 row_index_in_table = 0
                 table_cols_count = None
                 # Optionally add a blank line after closing a table
-                if output and output[-1].strip():
-                    output.append("")
-            output.append(line)
+                if output and output[-1] and not output[-1].isspace():
+                    output_append("")
+            output_append(line)
             i += 1
             continue
 
-        # Otherwise => it's a table row
-        columns = [c for c in line.split("|")[1:-1]]
+        # Otherwise => it's a table row. Drop the junk before the first
+        # pipe and after the last one in place instead of allocating a
+        # second list for the [1:-1] slice copy.
+        columns = line.split("|")
+        del columns[0], columns[-1]
 
         if not in_table:
             # Starting a brand-new table
@@ -620,7 +753,7 @@ def fix_multiline_table_cells(md_text: str) -> str:
             else:
                 # Mismatch => flush the old table and start a new one
                 flush_table()
-                output.append("")
+                output_append("")
                 current_table.clear()
                 current_table.append(columns)
                 table_cols_count = len(columns)
@@ -634,7 +767,7 @@ def fix_multiline_table_cells(md_text: str) -> str:
                 row_index_in_table += 1
             else:
                 flush_table()
-                output.append("")
+                output_append("")
                 current_table.clear()
                 current_table.append(columns)
                 table_cols_count = len(columns)
@@ -647,7 +780,8 @@ def fix_multiline_table_cells(md_text: str) -> str:
 
             if col_count == table_cols_count:
                 # 1) Check if it's a "continuation" line => all columns except last are blank?
-                if all(not c.strip() for c in columns[:-1]):
+                #    (blank test without the per-cell strip() allocation)
+                if all(not c or c.isspace() for c in columns[:-1]):
                     # => merge into last row's last column
                     current_table[-1][-1] += "<br>" + columns[-1].strip()
                 else:
@@ -656,7 +790,7 @@ def fix_multiline_table_cells(md_text: str) -> str:
 
             elif col_count < table_cols_count:
                 # Possibly a continuation or a row missing columns
-                if all(not c.strip() for c in columns[:-1]):
+                if all(not c or c.isspace() for c in columns[:-1]):
                     # merge into last column
                     # pad the last column with anything that *is* in columns[-1]
                     # or if col_count=0 => do nothing
@@ -675,7 +809,7 @@ def fix_multiline_table_cells(md_text: str) -> str:
                 merged_last = " / ".join(s.strip() for s in remainder)
                 merged.append(merged_last)
                 # Check if the first columns are all blank => continuation
-                if all(not c.strip() for c in merged[:-1]):
+                if all(not c or c.isspace() for c in merged[:-1]):
                     current_table[-1][-1] += "<br>" + merged[-1]
                 else:
                     current_table.append(merged)
@@ -686,8 +820,8 @@ def fix_multiline_table_cells(md_text: str) -> str:
     # Finish file => if we ended in a table => flush
     if in_table:
         flush_table()
-        if output and output[-1].strip():
-            output.append("")
+        if output and output[-1] and not output[-1].isspace():
+            output_append("")
 
     return "\n".join(output)
 
@@ -712,26 +846,33 @@ def main() -> None:
     if not args.output:
         _help(parser, "Error: No output file specified (use -o OUTPUT.md).")
 
-    # 2) Read input file
-    with open(args.input, "r", encoding="utf-8") as f:
-        original_md = f.read()
-
-    # 3) Parse into blocks
-    blocks = parse_markdown_into_blocks(original_md)
+    # 2) + 3) Stream the input file into blocks (see _iter_input_lines)
+    blocks = parse_markdown_into_blocks(_iter_input_lines(args.input))
 
-    # 4) Unify headings spread across two lines
-    blocks = unify_headings_spread_over_two_lines(blocks)
+    # 4) Unify headings spread across two lines. Skipped when the census
+    #    proves it a no-op: unifying only ever joins text into heading
+    #    blocks.
+    if any(block.type == "heading" for block in blocks):
+        blocks = unify_headings_spread_over_two_lines(blocks)
 
-    # 5) Merge multi-page tables
-    blocks = merge_multpage_tables(blocks)
+    # 5) Merge multi-page tables (needs at least two table blocks)
+    if sum(1 for block in blocks if block.type == "table") > 1:
+        blocks = merge_multpage_tables(blocks)
 
-    # 6) Remove '# Page X' headings and reassemble
-    merged_md = remove_page_headings_and_reassemble(blocks)
+    # 6) Remove '# Page X' headings and reassemble. The block list is
+    #    dead after this point; drop it before the whole-text passes so
+    #    peak memory holds one document copy, not the text plus all the
+    #    block line lists. Rebinding final_md at each later step frees
+    #    each predecessor string the same way.
+    final_md = remove_page_headings_and_reassemble(blocks)
+    del blocks
 
     # 7) Fix numeric headings, remove spurious '#', etc.
-    # final_md = fix_titles_and_headings_arm(merged_md)
-    final_md = fix_titles_and_headings(merged_md)
-    final_md = final_md.replace('<s>', '{s}').replace('<S>', '{S}')
+    # final_md = fix_titles_and_headings_arm(final_md)
+    final_md = fix_titles_and_headings(final_md)
+    # One pass over the (largest) string instead of two full
+    # replace() copies
+    final_md = _ANGLE_S_RE.sub(r'{\1}', final_md)
 
     # 8) Post-post-processing to fix broken bitfield tables
     final_md = fix_broken_bitfield_tables(final_md)
@@ -739,9 +880,13 @@ def main() -> None:
     # 9) Fix multiline table cells
     final_md = fix_multiline_table_cells(final_md)
 
-    # 10) Write output file
+    # 10) Write output file in bounded slices: one write of the whole
+    #     document would materialize a second full-size buffer for the
+    #     UTF-8 encoding, so encode-and-write a megabyte at a time.
+    chunk_size = 1 << 20
     with open(args.output, "w", encoding="utf-8") as out:
-        out.write(final_md)
+        for start in range(0, len(final_md), chunk_size):
+            out.write(final_md[start:start + chunk_size])
 
     print(f"Done! Processed '{args.input}' → '{args.output}'.")
     return